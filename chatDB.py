@@ -1,5 +1,6 @@
 import mysql.connector
 from pymongo import MongoClient
+from pymongo.errors import ExecutionTimeout
 import re
 import nltk
 from nltk.tokenize import word_tokenize
@@ -8,16 +9,270 @@ from nltk.stem import WordNetLemmatizer
 import matplotlib.pyplot as plt
 from tabulate import tabulate
 import pandas as pd
+import argparse
+import ast
+import bz2
+import csv
+import gzip
+import json
+import math
+import os
+import pickle
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import chain
+from statistics import NormalDist
 
 # Download necessary NLTK data
 nltk.download('punkt', quiet=True)
 nltk.download('stopwords', quiet=True)
 nltk.download('wordnet', quiet=True)
 
+# MySQL error raised when MAX_EXECUTION_TIME is exceeded
+ER_QUERY_TIMEOUT = 3024
+# Aggregation stages whose output is not proportional to the input size
+AGGREGATING_STAGES = ('$group', '$count', '$bucket', '$bucketAuto', '$facet', '$sortByCount')
+# Words that switch a count/average query to approximate mode
+APPROXIMATE_KEYWORDS = ('approximate', 'approx', 'estimate', 'roughly')
+
+def confidence_interval(estimate, standard_error, confidence):
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return estimate - z * standard_error, estimate + z * standard_error
+
+def proportion_confidence_interval(successes, trials, confidence, population_size=None):
+    """Wilson score interval for a proportion.
+
+    Unlike the plain normal approximation it keeps a useful width when every
+    (or no) trial succeeds. The finite population correction is applied by
+    inflating the effective sample size when population_size is known.
+    """
+    if population_size and trials >= population_size:
+        proportion = successes / trials
+        return proportion, proportion
+    n = trials
+    if population_size and population_size > 1:
+        n = trials * (population_size - 1) / (population_size - trials)
+    p = successes / trials
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half_width = z / denominator * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+def mean_confidence_interval(values, population_size=None, confidence=0.95):
+    """Sample mean with a normal-approximation confidence interval.
+
+    The finite population correction is applied when population_size is known.
+    """
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, None, None
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    standard_error = math.sqrt(variance / n)
+    if population_size and population_size > n:
+        standard_error *= math.sqrt((population_size - n) / (population_size - 1))
+    low, high = confidence_interval(mean, standard_error, confidence)
+    return mean, low, high
+
+# JOIN <table> [WHERE <sql condition>] WITH <collection> [WHERE <mongo filter>]
+#     ON <sql field> = <mongo field> [SELECT <fields>]
+FEDERATED_JOIN_PATTERN = re.compile(
+    r"^join\s+(?P<table>\w+)(?:\s+where\s+(?P<sql_where>.+?))?"
+    r"\s+with\s+(?P<collection>\w+)(?:\s+where\s+(?P<mongo_where>\{.*?\}))?"
+    r"\s+on\s+(?P<sql_key>[\w.]+)\s*=\s*(?P<mongo_key>[\w.]+)"
+    r"(?:\s+select\s+(?P<fields>.+?))?\s*;?$",
+    re.IGNORECASE | re.DOTALL
+)
+
+def join_key(value):
+    """Normalize a join key so e.g. MySQL DECIMAL and MongoDB double compare equal"""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+# Spilled joins never open more than this many partition files per side at once
+MAX_JOIN_PARTITIONS = 128
+# Re-partitioning stops after this many levels; what is left is one oversized key
+MAX_JOIN_DEPTH = 4
+
+def partition_count(rows, max_build_rows):
+    # Twice the minimum, so moderately uneven partitions still fit in memory
+    return min(MAX_JOIN_PARTITIONS, max(2, math.ceil(2 * rows / max_build_rows)))
+
+def write_partitions(rows, key, partition_files, seed, counts=None):
+    for row in rows:
+        value = join_key(row.get(key))
+        if value is None:
+            continue
+        index = hash((seed, value)) % len(partition_files)
+        pickle.dump(row, partition_files[index])
+        if counts is not None:
+            counts[index] += 1
+
+def read_partition(path):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def join_in_memory(build_rows, probe_rows, build_key, probe_key, merge):
+    table = defaultdict(list)
+    for row in build_rows:
+        value = join_key(row.get(build_key))
+        if value is not None:
+            table[value].append(row)
+    for probe_row in probe_rows:
+        for build_row in table.get(join_key(probe_row.get(probe_key)), ()):
+            yield merge(build_row, probe_row)
+
+def partition_to_files(rows, key, prefix, partitions, seed, counts=None):
+    paths = [f"{prefix}_{i}" for i in range(partitions)]
+    files = [open(path, 'wb') for path in paths]
+    try:
+        write_partitions(rows, key, files, seed, counts)
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+def join_spilled(build_path, probe_path, build_rows, build_key, probe_key, merge, max_build_rows, depth):
+    """Join one spilled partition pair, re-partitioning it while it is too big for memory"""
+    if build_rows <= max_build_rows:
+        yield from join_in_memory(read_partition(build_path), read_partition(probe_path),
+                                  build_key, probe_key, merge)
+        return
+
+    if depth < MAX_JOIN_DEPTH:
+        # A different seed spreads keys that collided at the previous level
+        partitions = partition_count(build_rows, max_build_rows)
+        counts = [0] * partitions
+        build_paths = partition_to_files(read_partition(build_path), build_key, build_path,
+                                         partitions, depth, counts)
+        if max(counts) < build_rows:
+            probe_paths = partition_to_files(read_partition(probe_path), probe_key, probe_path,
+                                             partitions, depth)
+            os.remove(build_path)
+            os.remove(probe_path)
+            for i in range(partitions):
+                yield from join_spilled(build_paths[i], probe_paths[i], counts[i], build_key, probe_key,
+                                        merge, max_build_rows, depth + 1)
+            return
+        for path in build_paths:
+            os.remove(path)
+
+    # All rows share one key: join it block by block, re-reading the probe side for each block
+    block = []
+    for row in read_partition(build_path):
+        block.append(row)
+        if len(block) >= max_build_rows:
+            yield from join_in_memory(block, read_partition(probe_path), build_key, probe_key, merge)
+            block = []
+    if block:
+        yield from join_in_memory(block, read_partition(probe_path), build_key, probe_key, merge)
+
+def hash_join(build_batches, probe_batches, build_key, probe_key, merge, max_build_rows,
+              estimated_build_rows=None):
+    """Inner hash join of two streams of row batches.
+
+    The build side is held in memory while it has at most max_build_rows
+    rows. Beyond that both sides are hash partitioned into temporary files
+    (a grace hash join), with the partition count derived from the build
+    size. Partitions that still have more than max_build_rows build rows
+    are re-partitioned with another hash seed, and a single key too large
+    for memory is joined in blocks, so at most max_build_rows build rows
+    are held in memory at any time.
+    """
+    buffered = []
+    for batch in build_batches:
+        buffered.extend(batch)
+        if len(buffered) > max_build_rows:
+            break
+    else:
+        yield from join_in_memory(buffered, (row for batch in probe_batches for row in batch),
+                                  build_key, probe_key, merge)
+        return
+
+    print(f"Join build side exceeds {max_build_rows} rows, spilling to disk")
+    partitions = partition_count(max(estimated_build_rows or 0, len(buffered)), max_build_rows)
+    spill_dir = tempfile.TemporaryDirectory(prefix="chatdb_join_")
+    try:
+        counts = [0] * partitions
+        build_rows = chain(buffered, (row for batch in build_batches for row in batch))
+        build_paths = partition_to_files(build_rows, build_key, os.path.join(spill_dir.name, "build"),
+                                         partitions, 0, counts)
+        probe_paths = partition_to_files((row for batch in probe_batches for row in batch), probe_key,
+                                         os.path.join(spill_dir.name, "probe"), partitions, 0)
+        for i in range(partitions):
+            yield from join_spilled(build_paths[i], probe_paths[i], counts[i], build_key, probe_key,
+                                    merge, max_build_rows, 1)
+    finally:
+        spill_dir.cleanup()
+
+def parse_date_range(nl_query):
+    """Find a date range in a natural language query.
+
+    Understands "between X and Y", "from X to Y", "on X", "in YYYY-MM",
+    "after/since/from X" and "before/until X", with dates as YYYY-MM-DD.
+    End dates of "between", "to" and "until" are inclusive; "before" and
+    "after" exclude the date itself. Returns a half-open (start, end) pair
+    of dates, either of which may be None, or None if there is no range.
+    """
+    day = r'(\d{4}-\d{2}-\d{2})'
+    closed = re.search(rf'\b(?:between {day} and|from {day} to) {day}', nl_query)
+    on_day = re.search(rf'\bon {day}', nl_query)
+    in_month = re.search(r'\b(?:in|during) (\d{4})-(\d{2})(?![\d-])', nl_query)
+    if closed:
+        start = closed.group(1) or closed.group(2)
+        return date.fromisoformat(start), date.fromisoformat(closed.group(3)) + timedelta(days=1)
+    if on_day:
+        start = date.fromisoformat(on_day.group(1))
+        return start, start + timedelta(days=1)
+    if in_month:
+        year, month = int(in_month.group(1)), int(in_month.group(2))
+        return date(year, month, 1), date(year + month // 12, month % 12 + 1, 1)
+
+    after = re.search(rf'\b(after|since|from) {day}', nl_query)
+    before = re.search(rf'\b(before|until) {day}', nl_query)
+    if not after and not before:
+        return None
+    start = end = None
+    if after:
+        start = date.fromisoformat(after.group(2))
+        if after.group(1) == 'after':
+            start += timedelta(days=1)
+    if before:
+        end = date.fromisoformat(before.group(2))
+        if before.group(1) == 'until':
+            end += timedelta(days=1)
+    return start, end
+
 class ChatDB:
-    def __init__(self):
+    def __init__(self, default_limit=1000, max_execution_ms=30000, confirm_callback=None,
+                 approx_sample_size=10000, approx_confidence=0.95, join_memory_rows=100000):
+        # Cost guard: queries estimated to return more than default_limit rows
+        # are truncated unless confirm_callback(estimated_rows, limit) returns
+        # True. Set default_limit or max_execution_ms to None to disable them.
+        self.default_limit = default_limit
+        self.max_execution_ms = max_execution_ms
+        self.confirm_callback = confirm_callback
+        self.last_query_info = {}
+        # Approximate mode: larger samples give tighter intervals but take longer
+        self.approx_sample_size = approx_sample_size
+        self.approx_confidence = approx_confidence
+        # Federated joins spill to disk once the build side exceeds this many rows
+        self.join_memory_rows = join_memory_rows
         self.sql_db = None
         self.sql_cursor = None
+        self.sql_connection_args = None
         self.nosql_client = None
         self.nosql_db = None
         self.current_db = None
@@ -27,12 +282,9 @@ class ChatDB:
 
     def connect_sql(self, host, user, password, database):
         try:
-            self.sql_db = mysql.connector.connect(
-                host=host,
-                user=user,
-                password=password,
-                database=database
-            )
+            # Kept so federated joins can open a dedicated streaming connection
+            self.sql_connection_args = dict(host=host, user=user, password=password, database=database)
+            self.sql_db = mysql.connector.connect(**self.sql_connection_args)
             self.sql_cursor = self.sql_db.cursor(dictionary=True)
             self.current_db = database
             self.current_db_type = "sql"
@@ -77,12 +329,112 @@ class ChatDB:
                 print(f"Error fetching sample data: {e}")
                 return None
 
+    def reset_query_info(self):
+        self.last_query_info = {'estimated_rows': None, 'limit': None, 'truncated': False, 'timed_out': False}
+
+    def choose_limit(self, estimated_rows):
+        """Return the row limit to apply for a result of estimated_rows, or None"""
+        self.last_query_info['estimated_rows'] = estimated_rows
+        if self.default_limit is None:
+            return None
+        if estimated_rows is not None and estimated_rows <= self.default_limit:
+            return None
+        if self.confirm_callback and estimated_rows is not None and self.confirm_callback(estimated_rows, self.default_limit):
+            return None
+        self.last_query_info['limit'] = self.default_limit
+        return self.default_limit
+
+    def check_truncation(self, rows):
+        # Guarded queries fetch one row past the limit to tell whether anything was cut off
+        limit = self.last_query_info.get('limit')
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            self.last_query_info['truncated'] = True
+            estimate = self.last_query_info.get('estimated_rows')
+            estimate_text = f" of an estimated {estimate}" if estimate is not None else ""
+            print(f"Note: Result truncated to {limit} rows{estimate_text}. "
+                  f"Add an explicit LIMIT or raise the default limit to see more.")
+        return rows
+
+    def estimate_sql_rows(self, query):
+        """Estimate the rows a SELECT will examine using EXPLAIN"""
+        try:
+            self.sql_cursor.execute(f"EXPLAIN {query}")
+            plan = self.sql_cursor.fetchall()
+            estimates = [row.get('rows') for row in plan if row.get('rows') is not None]
+            return int(max(estimates)) if estimates else None
+        except mysql.connector.Error:
+            return None
+
+    def guard_sql_query(self, query):
+        """Add a time budget and, for large unbounded SELECTs, a LIMIT to query"""
+        query = query.strip().rstrip(';')
+        lowered = query.lower()
+        if not lowered.startswith('select'):
+            return query
+
+        # Only a trailing LIMIT bounds the outer SELECT; one in a subquery or string does not
+        unbounded = not re.search(r'\blimit\s+\d+(\s*(,|offset)\s*\d+)?\s*$', lowered)
+        scalar_aggregate = (re.match(r'select\s+(count|avg|sum|min|max)\s*\(', lowered)
+                            and 'group by' not in lowered)
+        if unbounded and not scalar_aggregate:
+            limit = self.choose_limit(self.estimate_sql_rows(query))
+            if limit is not None:
+                query = f"{query} LIMIT {limit + 1}"
+
+        if self.max_execution_ms and 'max_execution_time' not in lowered:
+            query = re.sub(r'^select\b', f"SELECT /*+ MAX_EXECUTION_TIME({int(self.max_execution_ms)}) */",
+                           query, count=1, flags=re.IGNORECASE)
+        return query
+
+    def guard_pipeline(self, collection, pipeline):
+        """Append a $limit to pipelines whose output grows with the collection"""
+        stages = [next(iter(stage), None) for stage in pipeline if isinstance(stage, dict)]
+        if '$limit' in stages or any(stage in AGGREGATING_STAGES for stage in stages):
+            return pipeline
+        limit = self.choose_limit(collection.estimated_document_count())
+        if limit is None:
+            return pipeline
+        return list(pipeline) + [{'$limit': limit + 1}]
+
+    def aggregate_documents(self, table_name, pipeline):
+        collection = self.nosql_db[table_name]
+        pipeline = self.guard_pipeline(collection, pipeline)
+        options = {'maxTimeMS': int(self.max_execution_ms)} if self.max_execution_ms else {}
+        return self.check_truncation(list(collection.aggregate(pipeline, **options)))
+
+    def find_documents(self, table_name, query_filter, sort=None):
+        """Run find() under the cost guard.
+
+        estimated_document_count() is read from collection metadata, so it is
+        cheap but is an upper bound when a filter is given.
+        """
+        collection = self.nosql_db[table_name]
+        cursor = collection.find(query_filter)
+        if sort:
+            cursor = cursor.sort(*sort)
+        limit = self.choose_limit(collection.estimated_document_count())
+        if limit is not None:
+            cursor = cursor.limit(limit + 1)
+        if self.max_execution_ms:
+            cursor = cursor.max_time_ms(int(self.max_execution_ms))
+        return self.check_truncation(list(cursor))
+
+    def report_timeout(self):
+        self.last_query_info['timed_out'] = True
+        print(f"Query timed out after {self.max_execution_ms} ms. "
+              f"Narrow the query or raise the time budget.")
+
     def execute_query(self, table_name, query):
+        self.reset_query_info()
         if self.current_db_type == "sql":
             try:
-                self.sql_cursor.execute(query)
-                return self.sql_cursor.fetchall()
+                self.sql_cursor.execute(self.guard_sql_query(query))
+                return self.check_truncation(self.sql_cursor.fetchall())
             except mysql.connector.Error as err:
+                if err.errno == ER_QUERY_TIMEOUT:
+                    self.report_timeout()
+                    return None
                 print(f"Error executing SQL query: {err}")
                 return None
         elif self.current_db_type == "nosql":
@@ -100,25 +452,217 @@ class ChatDB:
                     pipeline = query
                 
                 # Execute MongoDB aggregation
-                result = list(self.nosql_db[table_name].aggregate(pipeline))
-                return result
+                return self.aggregate_documents(table_name, pipeline)
+            except ExecutionTimeout:
+                self.report_timeout()
+                return None
             except Exception as e:
                 print(f"Error executing MongoDB query: {e}")
                 return None
 
-    def process_natural_language_query(self, table_name, nl_query):
+    def get_sampling_key(self, table_name):
+        """Return the integer primary key column used for key sampling, or None"""
+        self.sql_cursor.execute(f"DESCRIBE {table_name}")
+        keys = [col for col in self.sql_cursor.fetchall() if col['Key'] == 'PRI']
+        auto_increment = [col for col in keys if 'auto_increment' in col['Extra']]
+        if auto_increment:
+            return auto_increment[0]['Field']
+        if len(keys) == 1 and 'int' in keys[0]['Type'].lower():
+            return keys[0]['Field']
+        return None
+
+    def get_table_row_estimate(self, table_name):
+        self.sql_cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table_name,))
+        row = self.sql_cursor.fetchone()
+        return int(row['TABLE_ROWS']) if row and row['TABLE_ROWS'] is not None else None
+
+    def probe_sql_keys(self, table_name, key, columns, sample_size):
+        """Sample rows by probing random primary key values.
+
+        Keys are drawn uniformly from [MIN(key), MAX(key)], so the rows found
+        are a simple random sample however sparse the key range is. Returns
+        (rows found, keys probed, size of the key range).
+        """
+        self.sql_cursor.execute(f"SELECT MIN({key}) AS lo, MAX({key}) AS hi FROM {table_name}")
+        bounds = self.sql_cursor.fetchone()
+        if bounds['lo'] is None:
+            return [], 0, 0
+        key_range = int(bounds['hi']) - int(bounds['lo']) + 1
+        row_estimate = self.get_table_row_estimate(table_name) or key_range
+        # Oversample to make up for gaps in the key range
+        draws = min(key_range, sample_size * 10,
+                    math.ceil(sample_size * key_range / max(row_estimate, 1)))
+        keys = random.sample(range(int(bounds['lo']), int(bounds['hi']) + 1), draws)
+
+        rows = []
+        column_list = ', '.join(columns)
+        for i in range(0, len(keys), 1000):
+            chunk = keys[i:i + 1000]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            self.sql_cursor.execute(
+                f"SELECT {column_list} FROM {table_name} WHERE {key} IN ({placeholders})", chunk)
+            rows.extend(self.sql_cursor.fetchall())
+        return rows, draws, key_range
+
+    def approximate_count(self, table_name, sample_size=None):
+        """Estimate the number of rows from key probes or table statistics"""
+        sample_size = sample_size or self.approx_sample_size
+        confidence = self.approx_confidence
+        if self.current_db_type == "nosql":
+            return [{
+                'approximate_count': self.nosql_db[table_name].estimated_document_count(),
+                'ci_low': None, 'ci_high': None, 'confidence': None,
+                'method': 'collection metadata'
+            }]
+
+        key = self.get_sampling_key(table_name)
+        if key is None:
+            return [{
+                'approximate_count': self.get_table_row_estimate(table_name),
+                'ci_low': None, 'ci_high': None, 'confidence': None,
+                'method': 'table statistics'
+            }]
+
+        rows, draws, key_range = self.probe_sql_keys(table_name, key, [key], sample_size)
+        if not draws:
+            return [{'approximate_count': 0, 'ci_low': 0, 'ci_high': 0,
+                     'confidence': confidence, 'method': 'empty table'}]
+        hit_rate = len(rows) / draws
+        low, high = proportion_confidence_interval(len(rows), draws, confidence, key_range)
+        return [{
+            'approximate_count': round(hit_rate * key_range),
+            'ci_low': max(len(rows), math.floor(low * key_range)),
+            'ci_high': min(key_range, math.ceil(high * key_range)),
+            'confidence': confidence,
+            'method': f'{draws} random {key} probes'
+        }]
+
+    def approximate_average(self, table_name, field, sample_size=None):
+        """Estimate AVG(field) from a random sample with a confidence interval"""
+        sample_size = sample_size or self.approx_sample_size
+        confidence = self.approx_confidence
+        if self.current_db_type == "nosql":
+            collection = self.nosql_db[table_name]
+            population_size = collection.estimated_document_count()
+            # $sample as the first stage uses a random cursor instead of a collection scan
+            documents = collection.aggregate([
+                {'$sample': {'size': sample_size}},
+                {'$match': {field: {'$type': 'number'}}},
+                {'$project': {'_id': 0, field: 1}}
+            ])
+            values = [float(doc[field].to_decimal()) if hasattr(doc[field], 'to_decimal') else float(doc[field])
+                      for doc in documents]
+            method = f'$sample of {sample_size} documents'
+        else:
+            key = self.get_sampling_key(table_name)
+            population_size = self.get_table_row_estimate(table_name)
+            if key is not None:
+                rows, draws, _ = self.probe_sql_keys(table_name, key, [field], sample_size)
+                method = f'{draws} random {key} probes'
+            else:
+                # Without a usable key fall back to Bernoulli sampling, which still scans the table
+                fraction = min(1.0, sample_size / max(population_size or 1, 1))
+                self.sql_cursor.execute(f"SELECT {field} FROM {table_name} WHERE RAND() < {fraction}")
+                rows = self.sql_cursor.fetchall()
+                method = f'random {fraction:.4%} row sample'
+            values = [float(row[field]) for row in rows if row[field] is not None]
+
+        if not values:
+            print(f"No numeric values of '{field}' found in the sample")
+            return None
+        mean, low, high = mean_confidence_interval(values, population_size, confidence)
+        return [{
+            'approximate_average': mean,
+            'ci_low': low,
+            'ci_high': high,
+            'confidence': confidence,
+            'sample_size': len(values),
+            'method': method
+        }]
+
+    def process_approximate_query(self, table_name, nl_query, sample_size=None):
+        match = re.search(r'sample (?:size |of )?(\d+)', nl_query)
+        if match and sample_size is None:
+            sample_size = int(match.group(1))
+        if 'count' in nl_query:
+            return self.approximate_count(table_name, sample_size)
+        words = nl_query.split()
+        field = words[words.index('average') + 1]
+        return self.approximate_average(table_name, field, sample_size)
+
+    def get_date_column(self, table_name):
+        """Return the column date ranges apply to: the partitioning column, else the first date column"""
+        self.sql_cursor.execute(
+            "SELECT PARTITION_EXPRESSION FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_EXPRESSION IS NOT NULL "
+            "LIMIT 1", (table_name,))
+        partition = self.sql_cursor.fetchone()
+        if partition:
+            return partition['PARTITION_EXPRESSION'].strip('`')
+        self.sql_cursor.execute(f"DESCRIBE {table_name}")
+        for col in self.sql_cursor.fetchall():
+            column_type = col['Type'].decode() if isinstance(col['Type'], (bytes, bytearray)) else col['Type']
+            if column_type.lower().startswith(('date', 'timestamp')):
+                return col['Field']
+        return None
+
+    def date_range_predicate(self, table_name, date_range):
+        """Turn a (start, end) range from parse_date_range into a WHERE condition.
+
+        Conditions compare the bare column with constant bounds (half-open
+        ranges rather than e.g. MONTH(col) = 1), which lets MySQL prune
+        partitions and use indexes. Returns None if the table has no date column.
+        """
+        column = self.get_date_column(table_name)
+        if column is None:
+            return None
+        conditions = []
+        if date_range[0] is not None:
+            conditions.append(f"`{column}` >= '{date_range[0].isoformat()}'")
+        if date_range[1] is not None:
+            conditions.append(f"`{column}` < '{date_range[1].isoformat()}'")
+        return ' AND '.join(conditions)
+
+    def process_natural_language_query(self, table_name, nl_query, approximate=False, sample_size=None):
+        """Answer a natural language query.
+
+        Count and average queries are answered approximately, with a
+        confidence interval, when approximate is set or the query says e.g.
+        "approximately". sample_size (or "sample 5000" in the query) trades
+        precision for latency.
+        """
+        self.reset_query_info()
         try:
             nl_query = nl_query.lower().strip()
+            approximate = approximate or any(word in nl_query for word in APPROXIMATE_KEYWORDS)
+            # A date range must never be dropped silently, so refuse the paths that cannot apply it
+            date_range = parse_date_range(nl_query)
+            if approximate and ('count' in nl_query or 'average' in nl_query):
+                if date_range:
+                    print("Approximate answers cannot be limited to a date range. "
+                          "Remove 'approximately' for an exact answer.")
+                    return None
+                return self.process_approximate_query(table_name, nl_query, sample_size)
+            if 'join with' in nl_query or 'joined with' in nl_query:
+                if date_range:
+                    print("Date ranges are not supported in joins.")
+                    return None
+                return self.process_join_query(table_name, nl_query)
             
             if self.current_db_type == "nosql":
+                if date_range:
+                    print("Date ranges are only supported for MySQL tables.")
+                    return None
                 # MongoDB specific queries
                 if 'show all' in nl_query or 'show me all' in nl_query:
-                    return list(self.nosql_db[table_name].find({}))
+                    return self.find_documents(table_name, {})
                     
                 elif 'count' in nl_query:
-                    return list(self.nosql_db[table_name].aggregate([
+                    return self.aggregate_documents(table_name, [
                         {'$count': 'total_records'}
-                    ]))
+                    ])
                     
                 elif 'greater than' in nl_query:
                     words = nl_query.split()
@@ -126,7 +670,7 @@ class ChatDB:
                     value_index = words.index('greater') + 2
                     field = words[field_index]
                     value = float(words[value_index])
-                    return list(self.nosql_db[table_name].find({field: {'$gt': value}}))
+                    return self.find_documents(table_name, {field: {'$gt': value}})
                     
                 elif 'less than' in nl_query:
                     words = nl_query.split()
@@ -134,22 +678,22 @@ class ChatDB:
                     value_index = words.index('less') + 2
                     field = words[field_index]
                     value = float(words[value_index])
-                    return list(self.nosql_db[table_name].find({field: {'$lt': value}}))
+                    return self.find_documents(table_name, {field: {'$lt': value}})
                     
                 elif 'average' in nl_query:
                     words = nl_query.split()
                     field_index = words.index('average') + 1
                     field = words[field_index]
-                    return list(self.nosql_db[table_name].aggregate([
+                    return self.aggregate_documents(table_name, [
                         {'$group': {'_id': None, 'average': {'$avg': f'${field}'}}}
-                    ]))
+                    ])
                     
                 elif 'sort by' in nl_query or 'order by' in nl_query:
                     words = nl_query.split()
                     field_index = words.index('by') + 1
                     field = words[field_index]
                     direction = -1 if 'descending' in nl_query else 1
-                    return list(self.nosql_db[table_name].find().sort(field, direction))
+                    return self.find_documents(table_name, {}, sort=(field, direction))
                 
                 else:
                     print("Query not recognized. Try these examples:")
@@ -161,13 +705,22 @@ class ChatDB:
                     
             else:
                 # SQL specific queries
+                # A date range is ANDed into whichever query the other words ask for
+                date_filter = self.date_range_predicate(table_name, date_range) if date_range else None
+                if date_range and not date_filter:
+                    print(f"Table '{table_name}' has no DATE, DATETIME or TIMESTAMP column to apply "
+                          f"the date range to. Re-import it partitioned by date to query by date.")
+                    return None
+                where_date = f" WHERE {date_filter}" if date_filter else ""
+                and_date = f" AND {date_filter}" if date_filter else ""
+
                 if 'greater than' in nl_query:
                     words = nl_query.split()
                     field_index = words.index('where') + 1
                     value_index = words.index('greater') + 2
                     field = words[field_index]
                     value = words[value_index]
-                    query = f"SELECT * FROM {table_name} WHERE {field} > {value}"
+                    query = f"SELECT * FROM {table_name} WHERE {field} > {value}{and_date}"
                     return self.execute_query(table_name, query)
                     
                 elif 'less than' in nl_query:
@@ -176,22 +729,22 @@ class ChatDB:
                     value_index = words.index('less') + 2
                     field = words[field_index]
                     value = words[value_index]
-                    query = f"SELECT * FROM {table_name} WHERE {field} < {value}"
+                    query = f"SELECT * FROM {table_name} WHERE {field} < {value}{and_date}"
                     return self.execute_query(table_name, query)
                     
                 elif 'show all' in nl_query or 'show me all' in nl_query:
-                    query = f"SELECT * FROM {table_name}"
+                    query = f"SELECT * FROM {table_name}{where_date}"
                     return self.execute_query(table_name, query)
                     
                 elif 'count' in nl_query:
-                    query = f"SELECT COUNT(*) as count FROM {table_name}"
+                    query = f"SELECT COUNT(*) as count FROM {table_name}{where_date}"
                     return self.execute_query(table_name, query)
                     
                 elif 'average' in nl_query:
                     words = nl_query.split()
                     field_index = words.index('average') + 1
                     field = words[field_index]
-                    query = f"SELECT AVG({field}) as average FROM {table_name}"
+                    query = f"SELECT AVG({field}) as average FROM {table_name}{where_date}"
                     return self.execute_query(table_name, query)
                     
                 elif 'sort by' in nl_query or 'order by' in nl_query:
@@ -202,7 +755,11 @@ class ChatDB:
                         field_index = words.index('order') + 2
                     field = words[field_index]
                     order = "DESC" if "descending" in nl_query else "ASC"
-                    query = f"SELECT * FROM {table_name} ORDER BY {field} {order}"
+                    query = f"SELECT * FROM {table_name}{where_date} ORDER BY {field} {order}"
+                    return self.execute_query(table_name, query)
+
+                elif date_filter:
+                    query = f"SELECT * FROM {table_name}{where_date}"
                     return self.execute_query(table_name, query)
                 
                 else:
@@ -212,8 +769,12 @@ class ChatDB:
                     print("- Count all records")
                     print("- Show average unit_price")
                     print("- Sort by unit_price descending")
+                    print("- Show data between 2023-01-01 and 2023-03-31")
                     return None
                 
+        except ExecutionTimeout:
+            self.report_timeout()
+            return None
         except Exception as e:
             print(f"Error processing query: {e}")
             print("Please try rephrasing your query.")
@@ -221,6 +782,8 @@ class ChatDB:
 
     def execute_custom_query(self, query):
         try:
+            if query.strip().lower().startswith('join '):
+                return self.execute_federated_query(query)
             if self.current_db_type == "sql":
                 return self.execute_query(None, query)
             elif self.current_db_type == "nosql":
@@ -231,6 +794,309 @@ class ChatDB:
             print(f"Error executing query: {e}")
             return None
 
+    def federated_join(self, sql_table, collection_name, sql_key, mongo_key, sql_where=None,
+                       mongo_filter=None, fields=None):
+        """Join a MySQL table with a MongoDB collection on the client.
+
+        Filters and projections are pushed down to each server, the smaller
+        side (by EXPLAIN / estimated_document_count) becomes the build side
+        of a hash join, and the result is capped by the cost guard. fields
+        may be qualified as table.field or collection.field. Columns present
+        on both sides are returned as collection.field for the MongoDB value.
+        """
+        self.reset_query_info()
+        if not self.has_federated_connections():
+            return None
+        stream_connection = None
+        try:
+            self.sql_cursor.execute(f"DESCRIBE {sql_table}")
+            sql_columns = [col['Field'] for col in self.sql_cursor.fetchall()]
+
+            # Split the requested fields between the two sides
+            sql_fields, mongo_fields = [], []
+            for field in fields or []:
+                owner, _, name = field.rpartition('.')
+                if owner == sql_table or (not owner and name in sql_columns):
+                    sql_fields.append(name)
+                else:
+                    mongo_fields.append(name)
+
+            if fields:
+                sql_select = ', '.join(f"`{c}`" for c in dict.fromkeys(sql_fields + [sql_key]))
+            else:
+                sql_select = '*'
+            sql_query = f"SELECT {sql_select} FROM {sql_table}"
+            if sql_where:
+                sql_query += f" WHERE {sql_where}"
+
+            pipeline = []
+            if mongo_filter:
+                pipeline.append({'$match': mongo_filter})
+            if fields:
+                projection = {name: 1 for name in mongo_fields + [mongo_key]}
+                if '_id' not in projection:
+                    projection['_id'] = 0
+                pipeline.append({'$project': projection})
+
+            sql_rows = self.estimate_sql_rows(sql_query)
+            mongo_rows = self.nosql_db[collection_name].estimated_document_count()
+            # The SQL side streams on its own connection so a join stopped at the row
+            # limit can drop it without reading the rest of the result
+            stream_connection = mysql.connector.connect(**self.sql_connection_args)
+            sql_batches = self.iter_query_batches(sql_table, sql_query, db_type="sql",
+                                                  connection=stream_connection)
+            mongo_batches = self.iter_query_batches(collection_name, pipeline, db_type="nosql")
+
+            def merge(sql_row, mongo_row):
+                row = dict(sql_row)
+                for name, value in mongo_row.items():
+                    row[f"{collection_name}.{name}" if name in row else name] = value
+                if fields:
+                    return {f: row.get(f, row.get(f.rpartition('.')[2])) for f in fields}
+                return row
+
+            if sql_rows is not None and sql_rows <= mongo_rows:
+                joined = hash_join(sql_batches, mongo_batches, sql_key, mongo_key,
+                                   merge, self.join_memory_rows, sql_rows)
+            else:
+                joined = hash_join(mongo_batches, sql_batches, mongo_key, sql_key,
+                                   lambda mongo_row, sql_row: merge(sql_row, mongo_row),
+                                   self.join_memory_rows, mongo_rows)
+
+            # For key/foreign-key joins the result is at most the size of the larger side
+            estimate = max(sql_rows, mongo_rows) if sql_rows is not None else None
+            limit = self.choose_limit(estimate)
+            results = []
+            for row in joined:
+                results.append(row)
+                if limit is not None and len(results) > limit:
+                    break
+            # Closing the generators stops the join and releases both server cursors
+            joined.close()
+            sql_batches.close()
+            mongo_batches.close()
+            return self.check_truncation(results)
+        except Exception as e:
+            print(f"Error executing federated join: {e}")
+            return None
+        finally:
+            if stream_connection is not None:
+                self.release_stream_connection(stream_connection)
+
+    def release_stream_connection(self, connection):
+        """Close a dedicated streaming connection without reading its unread rows"""
+        if connection.unread_result:
+            try:
+                self.sql_cursor.execute(f"KILL QUERY {connection.connection_id}")
+            except mysql.connector.Error:
+                pass  # the server also aborts the query once the socket is gone
+            connection.shutdown()
+        else:
+            connection.close()
+
+    def has_federated_connections(self):
+        if self.sql_db is None or self.nosql_db is None:
+            print("Federated joins need both a MySQL and a MongoDB connection. Connect to both first.")
+            return False
+        return True
+
+    def execute_federated_query(self, query):
+        """Run a query in the JOIN ... WITH ... ON ... syntax"""
+        match = FEDERATED_JOIN_PATTERN.match(query.strip())
+        if not match:
+            print("Invalid federated query. Expected:")
+            print("JOIN <table> [WHERE <sql condition>] WITH <collection> [WHERE <mongo filter>] "
+                  "ON <table field> = <collection field> [SELECT <fields>]")
+            return None
+        mongo_filter = ast.literal_eval(match['mongo_where']) if match['mongo_where'] else None
+        fields = [f.strip() for f in match['fields'].split(',')] if match['fields'] else None
+        return self.federated_join(
+            match['table'], match['collection'],
+            match['sql_key'].rpartition('.')[2], match['mongo_key'].rpartition('.')[2],
+            sql_where=match['sql_where'], mongo_filter=mongo_filter, fields=fields
+        )
+
+    def process_join_query(self, table_name, nl_query):
+        """Handle e.g. "join with country on store_location = name where unit_price greater than 10".
+
+        table_name is on the current backend and the named table or
+        collection on the other one.
+        """
+        if not self.has_federated_connections():
+            return None
+        match = re.search(r'join(?:ed)? with (\w+) on ([\w.]+)(?:\s*=\s*([\w.]+))?', nl_query)
+        if not match:
+            print("Try: join with <other table> on <field> = <other field>")
+            return None
+        other_name, own_key, other_key = match.group(1), match.group(2), match.group(3) or match.group(2)
+        own_key, other_key = own_key.rpartition('.')[2], other_key.rpartition('.')[2]
+        if self.current_db_type == "sql":
+            sql_table, collection_name, sql_key, mongo_key = table_name, other_name, own_key, other_key
+        else:
+            sql_table, collection_name, sql_key, mongo_key = other_name, table_name, other_key, own_key
+
+        # Push a single comparison filter down to whichever side has the field
+        sql_where, mongo_filter = None, None
+        comparison = re.search(r'where (\w+) (?:is )?(greater|less) than (-?[\d.]+)', nl_query)
+        if comparison:
+            field, direction, value = comparison.groups()
+            self.sql_cursor.execute(f"DESCRIBE {sql_table}")
+            if field in [col['Field'] for col in self.sql_cursor.fetchall()]:
+                sql_where = f"{field} {'>' if direction == 'greater' else '<'} {float(value)}"
+            else:
+                mongo_filter = {field: {'$gt' if direction == 'greater' else '$lt': float(value)}}
+        return self.federated_join(sql_table, collection_name, sql_key, mongo_key,
+                                   sql_where=sql_where, mongo_filter=mongo_filter)
+
+    def iter_query_batches(self, table_name, query=None, batch_size=10000, db_type=None, connection=None):
+        """Yield query results in lists of at most batch_size rows.
+
+        Rows are streamed from the server cursor instead of being fetched all
+        at once. With no query the whole table/collection is returned. For
+        MongoDB the query is an aggregation pipeline (or its string form).
+        db_type selects the backend and defaults to the current database.
+        connection streams SQL results on a caller-owned MySQL connection;
+        rows left unread are then discarded along with that connection.
+        """
+        db_type = db_type or self.current_db_type
+        if db_type == "sql":
+            if query is None:
+                query = f"SELECT * FROM {table_name}"
+            connection = connection or self.sql_db
+            # A separate unbuffered cursor keeps only the current batch client side
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                # An unbuffered result must be read to the end before the connection can be
+                # reused (e.g. after an aborted export); drop it batch by batch to keep memory flat
+                if connection is self.sql_db:
+                    if connection.unread_result:
+                        while cursor.fetchmany(batch_size):
+                            pass
+                    cursor.close()
+        elif db_type == "nosql":
+            if query is None or query == "show all data":
+                pipeline = []
+            elif isinstance(query, str):
+                pipeline = eval(query)
+            else:
+                pipeline = query
+            cursor = self.nosql_db[table_name].aggregate(pipeline, batchSize=batch_size)
+            try:
+                batch = []
+                for document in cursor:
+                    if '_id' in document:
+                        document['_id'] = str(document['_id'])
+                    batch.append(document)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+            finally:
+                cursor.close()
+
+    def export_query(self, table_name, output_file, query=None, file_format=None,
+                     compression=None, batch_size=10000):
+        """Stream query results to a CSV, JSON Lines, JSON or Parquet file.
+
+        Only one batch is held in memory at a time. file_format defaults to
+        the output file extension. compression is 'gzip' or 'bz2' for text
+        formats (inferred from a .gz/.bz2 suffix), or any codec pyarrow
+        supports (e.g. 'snappy', 'zstd') for Parquet. CSV columns are taken
+        from the first batch. The file is written under a temporary name and
+        only moved into place once complete. Returns the number of rows
+        written, or None on error.
+        """
+        name = output_file.lower()
+        for suffix, codec in (('.gz', 'gzip'), ('.bz2', 'bz2')):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                compression = compression or codec
+        if file_format is None:
+            file_format = os.path.splitext(name)[1].lstrip('.')
+        file_format = {'ndjson': 'jsonl'}.get(file_format, file_format)
+        if file_format not in ('csv', 'jsonl', 'json', 'parquet'):
+            print(f"Unsupported export format '{file_format}'. Choose csv, jsonl, json or parquet")
+            return None
+        if file_format != 'parquet' and compression not in (None, 'gzip', 'bz2'):
+            print(f"Unsupported compression '{compression}' for {file_format}. Choose gzip or bz2")
+            return None
+
+        # A failed export must not leave a truncated file behind under the final name
+        temp_file = f"{output_file}.tmp"
+        try:
+            batches = self.iter_query_batches(table_name, query, batch_size)
+            if file_format == 'parquet':
+                total_rows = self.write_parquet(batches, temp_file, compression)
+                if total_rows is not None and os.path.exists(temp_file):
+                    os.replace(temp_file, output_file)
+                return total_rows
+
+            if compression == 'gzip':
+                f = gzip.open(temp_file, 'wt', newline='')
+            elif compression == 'bz2':
+                f = bz2.open(temp_file, 'wt', newline='')
+            else:
+                f = open(temp_file, 'w', newline='')
+
+            total_rows = 0
+            with f:
+                writer = None
+                if file_format == 'json':
+                    f.write("[")
+                for batch in batches:
+                    if file_format == 'csv':
+                        if writer is None:
+                            writer = csv.DictWriter(f, fieldnames=list(batch[0].keys()), extrasaction='ignore')
+                            writer.writeheader()
+                        writer.writerows(batch)
+                    elif file_format == 'json':
+                        for i, row in enumerate(batch):
+                            f.write((",\n" if total_rows or i else "\n") + json.dumps(row, default=str))
+                    else:
+                        f.writelines(json.dumps(row, default=str) + "\n" for row in batch)
+                    total_rows += len(batch)
+                if file_format == 'json':
+                    f.write("\n]\n")
+            os.replace(temp_file, output_file)
+            return total_rows
+        except Exception as e:
+            print(f"Error exporting query result: {e}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            return None
+
+    def write_parquet(self, batches, output_file, compression=None):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("Parquet export requires pyarrow. Install it with: pip install pyarrow")
+            return None
+
+        writer = None
+        total_rows = 0
+        try:
+            for batch in batches:
+                if writer is None:
+                    table = pa.Table.from_pylist(batch)
+                    writer = pq.ParquetWriter(output_file, table.schema, compression=compression or 'snappy')
+                else:
+                    table = pa.Table.from_pylist(batch, schema=writer.schema)
+                writer.write_table(table)
+                total_rows += len(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+        return total_rows
+
     def visualize_data(self, data, chart_type='bar'):
         if not data:
             print("No data to visualize")
@@ -290,15 +1156,22 @@ class ChatDB:
                 f"Count the total number of records in {table_name}",
                 f"What is the average of unit_price in {table_name}",
                 f"Show me transactions where unit_price is greater than 10",
-                f"Sort the data in {table_name} by unit_price descending"
+                f"Sort the data in {table_name} by unit_price descending",
+                f"Approximately count the records in {table_name}"
             ]
+            try:
+                if self.get_date_column(table_name):
+                    suggestions.append(f"Count records in 2023-03")
+            except mysql.connector.Error:
+                pass
         else:
             suggestions = [
                 f"show all data",
                 f"count all records",
                 f"find transactions where unit_price is greater than 10",
                 f"sort by unit_price descending",
-                f"show average unit_price"
+                f"show average unit_price",
+                f"show approximate average unit_price"
             ]
         return suggestions
 
@@ -315,8 +1188,179 @@ def print_table(data):
     except Exception as e:
         print(f"Error displaying table: {e}")
 
+def load_batch_config(config_file):
+    """Load connection settings for batch mode from a JSON file"""
+    with open(config_file) as f:
+        config = json.load(f)
+    db_type = config.get('type')
+    if db_type == 'sql':
+        missing = [k for k in ('host', 'user', 'password', 'database') if k not in config]
+    elif db_type == 'nosql':
+        missing = [k for k in ('connection_string', 'database') if k not in config]
+    else:
+        raise ValueError("Config 'type' must be 'sql' or 'nosql'")
+    if missing:
+        raise ValueError(f"Config is missing keys: {', '.join(missing)}")
+    return config
+
+def load_batch_queries(query_file):
+    """Read batch queries from a JSON Lines file.
+
+    Each line is an object with 'table' and 'query', plus optional 'name'
+    and 'raw' (true to run the query as a custom query instead of NL).
+    Blank lines and lines starting with '#' are skipped.
+    """
+    queries = []
+    with open(query_file) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Warning: Skipping invalid query line {line_number}: {line[:100]}...")
+                continue
+            if 'query' not in entry or (not entry.get('raw') and 'table' not in entry):
+                print(f"Warning: Skipping query line {line_number} without 'table'/'query'")
+                continue
+            entry.setdefault('name', f"query_{len(queries) + 1}")
+            queries.append(entry)
+    return queries
+
+def connect_from_config(chatdb, config):
+    if config['type'] == 'sql':
+        return chatdb.connect_sql(config['host'], config['user'], config['password'], config['database'])
+    return chatdb.connect_nosql(config['connection_string'], config['database'])
+
+def run_batch(config, queries, output_dir, max_workers=4, default_limit=1000, max_execution_ms=30000):
+    """Run queries concurrently and write each result to output_dir.
+
+    Every worker thread opens its own ChatDB connection, since MySQL
+    connections and cursors must not be shared between threads. With
+    nobody to confirm large results, the cost guard truncates them at
+    default_limit rows. Returns the summary dict that is also written to summary.json.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    local = threading.local()
+    connections = []
+    connections_lock = threading.Lock()
+
+    def get_chatdb():
+        if getattr(local, 'chatdb', None) is None:
+            chatdb = ChatDB(default_limit=default_limit, max_execution_ms=max_execution_ms)
+            if not connect_from_config(chatdb, config):
+                raise ConnectionError(f"Could not connect to database '{config['database']}'")
+            local.chatdb = chatdb
+            with connections_lock:
+                connections.append(chatdb)
+        return local.chatdb
+
+    def run_one(index, entry):
+        start = time.perf_counter()
+        status = "ok"
+        rows = 0
+        query_info = {}
+        try:
+            chatdb = get_chatdb()
+            if entry.get('raw'):
+                if chatdb.current_db_type == "nosql" and entry.get('table'):
+                    result = chatdb.execute_query(entry['table'], entry['query'])
+                else:
+                    result = chatdb.execute_custom_query(entry['query'])
+            else:
+                result = chatdb.process_natural_language_query(entry['table'], entry['query'])
+            query_info = chatdb.last_query_info
+            if result is None:
+                status = "timeout" if query_info.get('timed_out') else "error"
+                result = []
+            rows = len(result)
+            # Names come from the query file; keep them from adding directories or escaping output_dir
+            safe_name = re.sub(r'[^\w.-]', '_', str(entry['name'])).lstrip('.')
+            output_file = os.path.join(output_dir, f"{index:04d}_{safe_name}.json")
+            with open(output_file, 'w') as f:
+                json.dump(result, f, default=str, indent=2)
+        except Exception as e:
+            status = f"error: {e}"
+            output_file = None
+        return {
+            'index': index,
+            'name': entry['name'],
+            'status': status,
+            'rows': rows,
+            'truncated': query_info.get('truncated', False),
+            'estimated_rows': query_info.get('estimated_rows'),
+            'seconds': round(time.perf_counter() - start, 4),
+            'output_file': output_file,
+        }
+
+    batch_start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_one, i, entry) for i, entry in enumerate(queries, 1)]
+        for future in as_completed(futures):
+            outcome = future.result()
+            results.append(outcome)
+            truncated = " (truncated)" if outcome['truncated'] else ""
+            print(f"[{outcome['status']}] {outcome['name']}: {outcome['rows']} rows{truncated} in {outcome['seconds']}s")
+
+    for chatdb in connections:
+        if chatdb.sql_db:
+            chatdb.sql_db.close()
+        if chatdb.nosql_client:
+            chatdb.nosql_client.close()
+
+    results.sort(key=lambda r: r['index'])
+    total_seconds = time.perf_counter() - batch_start
+    summary = {
+        'total_queries': len(results),
+        'succeeded': sum(1 for r in results if r['status'] == "ok"),
+        'failed': sum(1 for r in results if r['status'] != "ok"),
+        'total_seconds': round(total_seconds, 4),
+        'query_seconds': round(sum(r['seconds'] for r in results), 4),
+        'workers': max_workers,
+        'queries': results,
+    }
+    with open(os.path.join(output_dir, "summary.json"), 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"\nBatch finished: {summary['succeeded']}/{summary['total_queries']} succeeded "
+          f"in {summary['total_seconds']}s wall time "
+          f"({summary['query_seconds']}s total query time, {max_workers} workers)")
+    return summary
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="ChatDB: query SQL and MongoDB databases using natural language")
+    parser.add_argument("--batch", metavar="QUERY_FILE",
+                        help="Run queries from a JSON Lines file non-interactively")
+    parser.add_argument("--config", metavar="CONFIG_FILE",
+                        help="JSON file with connection settings (required with --batch)")
+    parser.add_argument("--output", metavar="DIR", default="batch_results",
+                        help="Directory to write query results to (default: batch_results)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Number of concurrent workers (default: 4)")
+    parser.add_argument("--limit", type=int, default=1000,
+                        help="Truncate large unbounded results to this many rows, 0 to disable (default: 1000)")
+    parser.add_argument("--timeout-ms", type=int, default=30000,
+                        help="Server-side time budget per query in ms, 0 to disable (default: 30000)")
+    args = parser.parse_args(argv)
+    if args.batch and not args.config:
+        parser.error("--config is required with --batch")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.limit < 0:
+        parser.error("--limit must not be negative")
+    if args.timeout_ms < 0:
+        parser.error("--timeout-ms must not be negative")
+    return args
+
+def confirm_large_result(estimated_rows, limit):
+    answer = input(f"This query may return about {estimated_rows} rows. "
+                   f"Fetch all of them instead of the first {limit}? (y/N): ")
+    return answer.strip().lower() in ('y', 'yes')
+
 def main():
-    chatdb = ChatDB()
+    chatdb = ChatDB(confirm_callback=confirm_large_result)
     
     while True:
         print("\n--- ChatDB Menu ---")
@@ -329,9 +1373,10 @@ def main():
         print("7. Visualize query result")
         print("8. Generate database schema")
         print("9. Get query suggestions")
-        print("10. Exit")
+        print("10. Export query result to file")
+        print("11. Exit")
         
-        choice = input("\nEnter your choice (1-10): ")
+        choice = input("\nEnter your choice (1-11): ")
         
         if choice == "1":
             host = input("Enter MySQL host: ")
@@ -390,6 +1435,9 @@ def main():
                 print("Example SQL query: SELECT * FROM table_name WHERE condition")
             else:
                 print("Example MongoDB query: [{'$match': {'field': 'value'}}]")
+            if chatdb.sql_db is not None and chatdb.nosql_db is not None:
+                print("Example federated join: JOIN sales WHERE unit_price > 10 WITH country "
+                      "ON store_location = name SELECT transaction_id, unit_price, region")
             query = input("\nEnter query: ")
             result = chatdb.execute_custom_query(query)
             if result:
@@ -434,6 +1482,23 @@ def main():
                 print(f"{i}. {suggestion}")
         
         elif choice == "10":
+            if not chatdb.current_db:
+                print("Please connect to a database first.")
+                continue
+            table_name = input("Enter table name: ")
+            if chatdb.current_db_type == "sql":
+                query = input("Enter SQL query (leave empty to export the whole table): ")
+            else:
+                query = input("Enter aggregation pipeline (leave empty to export the whole collection): ")
+            output_file = input("Enter output file (.csv, .jsonl, .json or .parquet): ")
+            compression = input("Enter compression (none/gzip/bz2, or snappy/zstd for parquet): ").lower()
+            compression = None if compression in ('', 'none') else compression
+            start = time.perf_counter()
+            rows = chatdb.export_query(table_name, output_file, query or None, compression=compression)
+            if rows is not None:
+                print(f"Exported {rows} rows to {output_file} in {time.perf_counter() - start:.2f}s")
+        
+        elif choice == "11":
             if chatdb.sql_db:
                 chatdb.sql_db.close()
             if chatdb.nosql_client:
@@ -445,4 +1510,16 @@ def main():
             print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.batch:
+        try:
+            batch_config = load_batch_config(args.config)
+            batch_queries = load_batch_queries(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"Error loading batch input: {e}")
+            raise SystemExit(1)
+        summary = run_batch(batch_config, batch_queries, args.output, args.workers,
+                            default_limit=args.limit or None, max_execution_ms=args.timeout_ms or None)
+        raise SystemExit(0 if summary['failed'] == 0 else 1)
+    else:
+        main()
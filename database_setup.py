@@ -5,6 +5,13 @@ from pymongo import MongoClient
 import os
 import numpy as np
 import json
+import glob
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+IMPORT_FILE_EXTENSIONS = ('.csv', '.json', '.jsonl')
+MANIFEST_FILE_NAME = '.chatdb_import_manifest.json'
 
 class DatabaseImporter:
     @staticmethod
@@ -49,7 +56,69 @@ class DatabaseImporter:
             return False
 
     @staticmethod
-    def import_csv_to_mysql(host, user, password, database_name, csv_file, table_name):
+    def detect_date_column(df):
+        """Return the first column that looks like a date, preferring names containing 'date'"""
+        candidates = [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
+        candidates += [c for c in df.columns if 'date' in str(c).lower() and c not in candidates]
+        for column in candidates:
+            parsed = pd.to_datetime(df[column].head(1000), errors='coerce')
+            if parsed.notna().mean() > 0.9:
+                return column
+        return None
+
+    @staticmethod
+    def build_date_partitions(start, end, partition_by):
+        """Return (name, upper bound) pairs covering start..end by month or day"""
+        freq = {'month': 'M', 'day': 'D'}[partition_by]
+        name_format = 'p%Y%m' if partition_by == 'month' else 'p%Y%m%d'
+        return [(period.strftime(name_format), (period + 1).start_time.strftime('%Y-%m-%d'))
+                for period in pd.period_range(start, end, freq=freq)]
+
+    @staticmethod
+    def get_date_partitioning(cursor, database_name, table_name):
+        """Return (date column, 'month'/'day', last partition bound) for a
+        date partitioned table, or None if the table is not partitioned that way.
+        """
+        cursor.execute(
+            "SELECT PARTITION_NAME, PARTITION_EXPRESSION, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION", (database_name, table_name))
+        partitions = cursor.fetchall()
+        dated = [row for row in partitions if row[2] != 'MAXVALUE']
+        if not dated or 'p_future' not in [row[0] for row in partitions]:
+            return None
+        name, expression, bound = dated[-1]
+        partition_by = 'day' if len(name) == len('pYYYYMMDD') else 'month'
+        return expression.strip('`'), partition_by, pd.Timestamp(bound.strip("'"))
+
+    @staticmethod
+    def extend_date_partitions(cursor, table_name, partition_by, last_bound, through_date):
+        """Split p_future so that rows up to through_date get their own partitions.
+
+        Rows already sitting in p_future are moved into the new partitions.
+        Returns the new upper bound of the last date partition.
+        """
+        through_date = pd.Timestamp(through_date)
+        if through_date < last_bound:
+            return last_bound
+        partitions = DatabaseImporter.build_date_partitions(last_bound, through_date, partition_by)
+        partition_defs = [f"PARTITION {name} VALUES LESS THAN ('{bound}')" for name, bound in partitions]
+        partition_defs.append("PARTITION p_future VALUES LESS THAN (MAXVALUE)")
+        cursor.execute(f"ALTER TABLE {table_name} REORGANIZE PARTITION p_future INTO ({', '.join(partition_defs)})")
+        print(f"Added {len(partitions)} partition(s) to '{table_name}': {partitions[0][0]} to {partitions[-1][0]}")
+        return pd.Timestamp(partitions[-1][1])
+
+    @staticmethod
+    def import_csv_to_mysql(host, user, password, database_name, csv_file, table_name,
+                            partition_by=None, date_column=None):
+        """Import a CSV file into a new MySQL table.
+
+        With partition_by='month' or 'day' the table gets a generated
+        AUTO_INCREMENT primary key and is RANGE partitioned on date_column
+        (detected when not given), so date-bounded queries only read the
+        matching partitions and old data can be removed with
+        drop_partitions_before.
+        """
         try:
             # Read CSV file
             df = pd.read_csv(csv_file)
@@ -63,23 +132,60 @@ class DatabaseImporter:
             )
             cursor = conn.cursor()
 
+            key_column = None
+            if partition_by:
+                if partition_by not in ('month', 'day'):
+                    raise ValueError("partition_by must be 'month' or 'day'")
+                date_column = date_column or DatabaseImporter.detect_date_column(df)
+                if date_column is None:
+                    raise ValueError("No date column found to partition on. Please specify one")
+                df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
+                missing_dates = df[date_column].isna().sum()
+                if missing_dates:
+                    print(f"Warning: Skipping {missing_dates} rows without a valid {date_column}")
+                    df = df.dropna(subset=[date_column])
+                # Sorting by date makes each insert batch land in one or two partitions
+                df = df.sort_values(date_column)
+                key_column = 'row_id' if 'id' in df.columns else 'id'
+
             # Dynamically create table schema based on DataFrame columns and data types
             columns = []
+            if key_column:
+                columns.append(f"`{key_column}` BIGINT NOT NULL AUTO_INCREMENT")
             for column, dtype in df.dtypes.items():
                 mysql_type = DatabaseImporter.get_mysql_type(dtype)
+                if column == date_column and mysql_type == "DATETIME" and (df[column].dt.normalize() == df[column]).all():
+                    mysql_type = "DATE"
                 columns.append(f"`{column}` {mysql_type}")
 
+            partition_clause = ""
+            if partition_by:
+                # MySQL requires the partitioning column in every unique key
+                columns.append(f"PRIMARY KEY (`{key_column}`, `{date_column}`)")
+                partitions = DatabaseImporter.build_date_partitions(
+                    df[date_column].min(), df[date_column].max(), partition_by)
+                if len(partitions) >= 8192:
+                    raise ValueError(f"{len(partitions)} partitions exceed MySQL's limit of 8192. "
+                                     "Partition by month instead")
+                partition_defs = [f"PARTITION {name} VALUES LESS THAN ('{bound}')" for name, bound in partitions]
+                # Rows newer than the last partition are kept in a catch-all partition
+                partition_defs.append("PARTITION p_future VALUES LESS THAN (MAXVALUE)")
+                partition_clause = (f"PARTITION BY RANGE COLUMNS(`{date_column}`) (\n                "
+                                    + ",\n                ".join(partition_defs) + "\n            )")
+
             create_table_query = f"""
             CREATE TABLE {table_name} (
                 {', '.join(columns)}
             )
+            {partition_clause}
             """
             cursor.execute(create_table_query)
             print(f"Created table with schema:\n{create_table_query}")
             
             # Prepare the insert query
+            column_list = ', '.join(f"`{c}`" for c in df.columns)
             placeholders = ', '.join(['%s'] * len(df.columns))
-            insert_query = f"INSERT INTO {table_name} VALUES ({placeholders})"
+            insert_query = f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})"
             
             # Convert DataFrame to list of tuples
             values = [tuple(x) for x in df.replace({np.nan: None}).values]
@@ -99,6 +205,40 @@ class DatabaseImporter:
             print(f"Error importing data to MySQL: {e}")
             return False
 
+    @staticmethod
+    def drop_partitions_before(host, user, password, database_name, table_name, cutoff_date):
+        """Drop every date partition that only holds rows older than cutoff_date.
+
+        Dropping a partition is a metadata operation, so this takes the same
+        time however many rows the partitions hold.
+        """
+        try:
+            conn = mysql.connector.connect(
+                host=host,
+                user=user,
+                password=password,
+                database=database_name
+            )
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+                "ORDER BY PARTITION_ORDINAL_POSITION", (database_name, table_name))
+            cutoff = pd.Timestamp(cutoff_date)
+            expired = [name for name, bound in cursor.fetchall()
+                       if bound != 'MAXVALUE' and pd.Timestamp(bound.strip("'")) <= cutoff]
+            if not expired:
+                print(f"No partitions of '{table_name}' end before {cutoff_date}")
+                conn.close()
+                return []
+            cursor.execute(f"ALTER TABLE {table_name} DROP PARTITION {', '.join(expired)}")
+            conn.close()
+            print(f"Dropped {len(expired)} partition(s) from '{table_name}': {', '.join(expired)}")
+            return expired
+        except Exception as e:
+            print(f"Error dropping partitions: {e}")
+            return None
+
     @staticmethod
     def import_csv_to_mongodb(connection_string, database_name, csv_file, collection_name):
         try:
@@ -221,6 +361,329 @@ class DatabaseImporter:
             print("4. Nested JSON with array: {'data': [{'field': 'value'}, ...]}")
             return False
 
+    @staticmethod
+    def import_files_parallel(files, write_batch, manifest_file, manifest_key,
+                              as_tuples=False, workers=None, batch_size=1000, max_queued_batches=8,
+                              date_columns=None):
+        """Parse files in a process pool and pass their batches to write_batch.
+
+        Workers push batches into a bounded queue and block while it is full,
+        so at most max_queued_batches batches are held in memory at once.
+        The manifest records how many rows of each file have been written,
+        updated after every batch. Completed files are skipped, and a file
+        that failed part-way is resumed after its written rows, so a re-run
+        never appends rows twice. Files that changed since they were first
+        imported are skipped with a warning. date_columns are parsed as dates
+        by the workers. Returns the list of files completed in this run.
+        """
+        manifest = load_import_manifest(manifest_file)
+        file_progress = manifest.setdefault(manifest_key, {})
+        pending_files, skip_rows = [], {}
+        for f in files:
+            progress = file_progress.get(os.path.abspath(f))
+            if isinstance(progress, list):
+                # Older manifests stored only the signature of completed files
+                progress = {'signature': progress, 'rows': None, 'complete': True}
+            if progress is None:
+                pending_files.append(f)
+                skip_rows[f] = 0
+            elif progress['signature'] != file_signature(f):
+                # Appending a changed file again would duplicate the rows already imported
+                print(f"Warning: '{f}' changed since it was imported and was skipped. "
+                      f"Remove its rows and its manifest entry to import it again")
+            elif not progress['complete']:
+                pending_files.append(f)
+                skip_rows[f] = progress['rows']
+                print(f"Resuming '{f}' after {progress['rows']} already imported records")
+        skipped = len(files) - len(pending_files)
+        if skipped:
+            print(f"Skipping {skipped} file(s) already imported")
+        if not pending_files:
+            print("No new files to import")
+            return []
+
+        imported = []
+        with multiprocessing.Manager() as manager:
+            batch_queue = manager.Queue(maxsize=max_queued_batches)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(parse_file_to_queue, f, batch_queue, batch_size, as_tuples,
+                                    date_columns, skip_rows[f]): f
+                    for f in pending_files
+                }
+                remaining = set(pending_files)
+                row_counts = {f: 0 for f in pending_files}
+                failed_files = set()
+                while remaining:
+                    try:
+                        kind, file_path, payload = batch_queue.get(timeout=1)
+                    except queue.Empty:
+                        # A worker that died without reporting would otherwise hang the writer
+                        for future, file_path in futures.items():
+                            if file_path in remaining and future.done() and future.exception():
+                                print(f"Error parsing '{file_path}': {future.exception()}")
+                                remaining.discard(file_path)
+                        continue
+
+                    if kind == 'batch':
+                        if file_path in failed_files:
+                            continue  # keep draining so the worker is never blocked on a full queue
+                        try:
+                            write_batch(payload)
+                        except Exception as e:
+                            print(f"Error writing batch from '{file_path}': {e}")
+                            failed_files.add(file_path)
+                            continue
+                        row_counts[file_path] += len(payload[1] if as_tuples else payload)
+                        file_progress[os.path.abspath(file_path)] = {
+                            'signature': file_signature(file_path),
+                            'rows': skip_rows[file_path] + row_counts[file_path],
+                            'complete': False
+                        }
+                        save_import_manifest(manifest_file, manifest)
+                    elif kind == 'done':
+                        remaining.discard(file_path)
+                        if file_path in failed_files:
+                            continue
+                        file_progress[os.path.abspath(file_path)] = {
+                            'signature': file_signature(file_path),
+                            'rows': skip_rows[file_path] + row_counts[file_path],
+                            'complete': True
+                        }
+                        save_import_manifest(manifest_file, manifest)
+                        imported.append(file_path)
+                        print(f"Imported {row_counts[file_path]} records from '{file_path}'")
+                    elif kind == 'error':
+                        remaining.discard(file_path)
+                        print(f"Error parsing '{file_path}': {payload}")
+
+        print(f"\nImported {len(imported)} of {len(pending_files)} pending file(s)")
+        return imported
+
+    @staticmethod
+    def import_directory_to_mysql(host, user, password, database_name, path, table_name,
+                                  workers=None, batch_size=1000, max_queued_batches=8, manifest_file=None):
+        """Import every CSV file in a directory or glob into one MySQL table.
+
+        Unlike import_csv_to_mysql the table is kept between runs, so
+        re-running only appends files not yet in the manifest. For a date
+        partitioned table, partitions are added for dates past the last one.
+        """
+        try:
+            files = [f for f in find_import_files(path) if f.lower().endswith('.csv')]
+            if not files:
+                print(f"No CSV files found for '{path}'")
+                return False
+            manifest_file = manifest_file or default_manifest_file(path)
+
+            conn = mysql.connector.connect(
+                host=host,
+                user=user,
+                password=password,
+                database=database_name
+            )
+            cursor = conn.cursor()
+
+            # Infer the schema from the head of the first file
+            sample = pd.read_csv(files[0], nrows=1000)
+            columns = []
+            for column, dtype in sample.dtypes.items():
+                mysql_type = DatabaseImporter.get_mysql_type(dtype)
+                columns.append(f"`{column}` {mysql_type}")
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)})")
+
+            # Date columns of an existing (e.g. date partitioned) table need real dates, not CSV strings
+            cursor.execute(f"DESCRIBE {table_name}")
+            date_columns = []
+            for field, column_type, *_ in cursor.fetchall():
+                if isinstance(column_type, (bytes, bytearray)):
+                    column_type = column_type.decode()
+                if column_type.lower().startswith(('date', 'timestamp')):
+                    date_columns.append(field)
+
+            # New dates in a date partitioned table get their own partitions instead of p_future
+            partitioning = DatabaseImporter.get_date_partitioning(cursor, database_name, table_name)
+            partition_state = {'last_bound': partitioning[2] if partitioning else None}
+
+            def write_batch(payload):
+                column_names, rows = payload
+                if partitioning and partitioning[0] in column_names:
+                    index = column_names.index(partitioning[0])
+                    dates = [row[index] for row in rows if pd.notna(row[index])]
+                    if dates and max(dates) >= partition_state['last_bound']:
+                        partition_state['last_bound'] = DatabaseImporter.extend_date_partitions(
+                            cursor, table_name, partitioning[1], partition_state['last_bound'], max(dates))
+                column_list = ', '.join(f"`{c}`" for c in column_names)
+                placeholders = ', '.join(['%s'] * len(column_names))
+                cursor.executemany(f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})", rows)
+                conn.commit()
+
+            DatabaseImporter.import_files_parallel(
+                files, write_batch, manifest_file, f"mysql:{database_name}.{table_name}",
+                as_tuples=True, workers=workers, batch_size=batch_size,
+                max_queued_batches=max_queued_batches, date_columns=date_columns
+            )
+            conn.close()
+            return True
+        except Exception as e:
+            print(f"Error importing directory to MySQL: {e}")
+            return False
+
+    @staticmethod
+    def import_directory_to_mongodb(connection_string, database_name, path, collection_name,
+                                    workers=None, batch_size=1000, max_queued_batches=8, manifest_file=None):
+        """Import every CSV, JSON and JSON Lines file in a directory or glob into one collection"""
+        try:
+            files = find_import_files(path)
+            if not files:
+                print(f"No CSV or JSON files found for '{path}'")
+                return False
+            manifest_file = manifest_file or default_manifest_file(path)
+
+            client = MongoClient(connection_string)
+            collection = client[database_name][collection_name]
+
+            def write_batch(records):
+                collection.insert_many(records)
+
+            DatabaseImporter.import_files_parallel(
+                files, write_batch, manifest_file, f"mongodb:{database_name}.{collection_name}",
+                workers=workers, batch_size=batch_size, max_queued_batches=max_queued_batches
+            )
+            client.close()
+            return True
+        except Exception as e:
+            print(f"Error importing directory to MongoDB: {e}")
+            return False
+
+def find_import_files(path):
+    """Return the data files in a directory, or the files matching a glob pattern"""
+    if os.path.isdir(path):
+        candidates = [os.path.join(path, name) for name in os.listdir(path)]
+    else:
+        candidates = glob.glob(path)
+    return sorted(f for f in candidates
+                  if os.path.isfile(f) and f.lower().endswith(IMPORT_FILE_EXTENSIONS))
+
+def default_manifest_file(path):
+    directory = path if os.path.isdir(path) else os.path.dirname(path) or '.'
+    return os.path.join(directory, MANIFEST_FILE_NAME)
+
+def file_signature(file_path):
+    """Size and modification time, used to detect files changed since import"""
+    stat = os.stat(file_path)
+    return [stat.st_size, stat.st_mtime]
+
+def load_import_manifest(manifest_file):
+    if not os.path.exists(manifest_file):
+        return {}
+    try:
+        with open(manifest_file) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Ignoring unreadable import manifest '{manifest_file}': {e}")
+        return {}
+
+def save_import_manifest(manifest_file, manifest):
+    # Write to a temporary file first so an interrupted run never leaves a corrupt manifest
+    temp_file = f"{manifest_file}.tmp"
+    with open(temp_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_file, manifest_file)
+
+def iter_json_record_batches(json_file, batch_size):
+    """Yield lists of records from a JSON Lines, JSON array or nested JSON file.
+
+    JSON Lines files are streamed line by line; other layouts have to be
+    loaded whole.
+    """
+    with open(json_file) as f:
+        first_line = f.readline().strip()
+        try:
+            first_record = json.loads(first_line) if first_line else None
+        except json.JSONDecodeError:
+            first_record = None
+
+        if isinstance(first_record, dict):
+            batch = [first_record] if first_record else []
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Warning: Skipping invalid JSON line in '{json_file}': {line[:100]}...")
+                    continue
+                if record:
+                    batch.append(record)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            return
+
+        f.seek(0)
+        data = json.load(f)
+
+    records = []
+    if isinstance(data, list):
+        records = data
+    elif isinstance(data, dict):
+        # Check if it's a nested structure with an array
+        for value in data.values():
+            if isinstance(value, list):
+                records = value
+                break
+        if not records:
+            records = [data]
+    else:
+        records = [data]
+    for i in range(0, len(records), batch_size):
+        yield records[i:i + batch_size]
+
+def parse_file_to_queue(file_path, batch_queue, batch_size, as_tuples, date_columns=None, skip_rows=0):
+    """Process pool worker: parse one file and push its batches onto batch_queue.
+
+    Batches are (column_names, rows) when as_tuples is set, otherwise lists
+    of dicts. The first skip_rows records, already imported by an earlier
+    run, are parsed but not sent. A final 'done' or 'error' message marks
+    the end of the file.
+    """
+    try:
+        if file_path.lower().endswith('.csv'):
+            for chunk in pd.read_csv(file_path, chunksize=batch_size):
+                if skip_rows:
+                    skipped = min(skip_rows, len(chunk))
+                    chunk = chunk.iloc[skipped:]
+                    skip_rows -= skipped
+                    if chunk.empty:
+                        continue
+                for column in date_columns or []:
+                    if column in chunk.columns:
+                        chunk[column] = pd.to_datetime(chunk[column], errors='coerce')
+                chunk = chunk.replace({np.nan: None})
+                if as_tuples:
+                    payload = (list(chunk.columns), [tuple(x) for x in chunk.values])
+                else:
+                    payload = chunk.to_dict('records')
+                batch_queue.put(('batch', file_path, payload))
+        elif as_tuples:
+            raise ValueError("Only CSV files can be imported into MySQL")
+        else:
+            for records in iter_json_record_batches(file_path, batch_size):
+                if skip_rows:
+                    skipped = min(skip_rows, len(records))
+                    records = records[skipped:]
+                    skip_rows -= skipped
+                    if not records:
+                        continue
+                batch_queue.put(('batch', file_path, records))
+        batch_queue.put(('done', file_path, None))
+    except Exception as e:
+        batch_queue.put(('error', file_path, str(e)))
+
 def validate_csv_file(csv_file):
     """Validate if the CSV file exists and can be read"""
     if not os.path.exists(csv_file):
@@ -301,9 +764,11 @@ def setup_database():
     while True:
         print("\n1. Setup MySQL Database")
         print("2. Setup MongoDB Database")
-        print("3. Exit")
+        print("3. Import directory or glob of files (parallel, incremental)")
+        print("4. Drop old date partitions (MySQL)")
+        print("5. Exit")
 
-        choice = input("\nEnter your choice (1-3): ")
+        choice = input("\nEnter your choice (1-5): ")
 
         if choice == "1":
             print("\n--- MySQL Database Setup ---")
@@ -313,12 +778,18 @@ def setup_database():
             database_name = input("Enter new database name: ")
             csv_file = input("Enter path to CSV file: ")
             table_name = input("Enter table name for the data: ")
+            partition_by = input("Partition table by date? (none/month/day, default: none): ").lower()
+            partition_by = partition_by if partition_by in ('month', 'day') else None
+            date_column = None
+            if partition_by:
+                date_column = input("Enter date column (leave empty to detect): ") or None
 
             if not validate_csv_file(csv_file):
                 continue
 
             if DatabaseImporter.create_mysql_database(host, user, password, database_name):
-                DatabaseImporter.import_csv_to_mysql(host, user, password, database_name, csv_file, table_name)
+                DatabaseImporter.import_csv_to_mysql(host, user, password, database_name, csv_file, table_name,
+                                                     partition_by=partition_by, date_column=date_column)
                 print("\nMySQL setup completed!")
                 print(f"You can now connect to the database using:")
                 print(f"Host: {host}")
@@ -354,6 +825,46 @@ def setup_database():
                 print("Invalid file type. Please choose 'csv' or 'json'")
 
         elif choice == "3":
+            print("\n--- Directory Import ---")
+            target = input("Enter target database (mysql/mongodb): ").lower()
+            path = input("Enter directory or glob pattern (e.g. data/sales_*.csv): ")
+            workers = input("Enter number of parser processes (default: CPU count): ")
+            workers = int(workers) if workers.isdigit() and int(workers) > 0 else None
+
+            if not find_import_files(path):
+                print(f"Error: No CSV or JSON files found for '{path}'")
+                continue
+
+            if target == 'mysql':
+                host = input("Enter MySQL host (default: localhost): ") or "localhost"
+                user = input("Enter MySQL user (default: root): ") or "root"
+                password = input("Enter MySQL password: ")
+                database_name = input("Enter existing database name: ")
+                table_name = input("Enter table name for the data: ")
+                if DatabaseImporter.import_directory_to_mysql(host, user, password, database_name, path,
+                                                              table_name, workers=workers):
+                    print("\nDirectory import completed!")
+            elif target == 'mongodb':
+                connection_string = input("Enter MongoDB connection string (default: mongodb://localhost:27017/): ") or "mongodb://localhost:27017/"
+                database_name = input("Enter database name: ")
+                collection_name = input("Enter collection name for the data: ")
+                if DatabaseImporter.import_directory_to_mongodb(connection_string, database_name, path,
+                                                                collection_name, workers=workers):
+                    print("\nDirectory import completed!")
+            else:
+                print("Invalid target. Please choose 'mysql' or 'mongodb'")
+
+        elif choice == "4":
+            print("\n--- Drop Old Partitions ---")
+            host = input("Enter MySQL host (default: localhost): ") or "localhost"
+            user = input("Enter MySQL user (default: root): ") or "root"
+            password = input("Enter MySQL password: ")
+            database_name = input("Enter database name: ")
+            table_name = input("Enter partitioned table name: ")
+            cutoff_date = input("Drop data older than (YYYY-MM-DD): ")
+            DatabaseImporter.drop_partitions_before(host, user, password, database_name, table_name, cutoff_date)
+
+        elif choice == "5":
             print("Exiting database setup utility...")
             break
         else: